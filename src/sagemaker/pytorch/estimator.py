@@ -35,6 +35,20 @@ from sagemaker.workflow.entities import PipelineVariable
 
 logger = logging.getLogger("sagemaker")
 
+_SAGEMAKER_METRICS_MIN_VERSION = Version("1.3")
+
+
+def _supports_sagemaker_metrics(framework_version):
+    """Returns True if ``framework_version`` is PyTorch v1.3 or greater.
+
+    Plain numeric versions such as ``"1.13.1"`` are compared as integer tuples;
+    anything else falls back to ``packaging.version.Version``.
+    """
+    parts = framework_version.split(".")
+    if all(part.isdigit() for part in parts):
+        return tuple(int(part) for part in parts) >= _SAGEMAKER_METRICS_MIN_VERSION.release
+    return Version(framework_version) >= _SAGEMAKER_METRICS_MIN_VERSION
+
 
 class PyTorch(Framework):
     """Handle end-to-end training and deployment of custom PyTorch code."""
@@ -265,17 +279,16 @@ class PyTorch(Framework):
 
         if "enable_sagemaker_metrics" not in kwargs:
             # enable sagemaker metrics for PT v1.3 or greater:
-            if self.framework_version and Version(self.framework_version) >= Version("1.3"):
+            if self.framework_version and _supports_sagemaker_metrics(self.framework_version):
                 kwargs["enable_sagemaker_metrics"] = True
 
         super(PyTorch, self).__init__(
             entry_point, source_dir, hyperparameters, image_uri=image_uri, **kwargs
         )
 
-        if "entry_point" not in kwargs:
-            kwargs["entry_point"] = entry_point
-
-        if distribution is not None:
+        # An empty distribution only needs validating when instance groups are
+        # configured, since validation fills in the training instance group.
+        if distribution or (distribution is not None and self.instance_groups):
             # rewrite pytorchddp to smdistributed
             if "pytorchddp" in distribution:
                 if "smdistributed" in distribution:
@@ -285,11 +298,14 @@ class PyTorch(Framework):
                         distribution,
                     )
 
-                # convert pytorchddp distribution into smdistributed distribution
-                distribution = distribution.copy()
-                distribution["smdistributed"] = {"dataparallel": distribution["pytorchddp"]}
-                del distribution["pytorchddp"]
+                # convert pytorchddp distribution into smdistributed distribution;
+                # the dict belongs to the caller, so build a new one instead of mutating it
+                pytorch_ddp = distribution["pytorchddp"]
+                distribution = {k: v for k, v in distribution.items() if k != "pytorchddp"}
+                distribution["smdistributed"] = {"dataparallel": pytorch_ddp}
 
+            # validate_distribution reads the entry point from kwargs
+            kwargs["entry_point"] = entry_point
             distribution = validate_distribution(
                 distribution,
                 self.instance_groups,
@@ -326,6 +342,22 @@ class PyTorch(Framework):
                 kwargs["profiler_config"], image_uri, self._framework_name, framework_version
             )
 
+        # distribution and compiler_config are fixed after construction, so the
+        # JSON-encoded hyperparameters they contribute are computed only once.
+        self._distribution_hyperparameters = {}
+        distribution_config = self._pytorch_distribution_configuration(
+            distribution=self.distribution
+        )
+        if distribution_config:
+            self._distribution_hyperparameters = EstimatorBase._json_encode_hyperparameters(
+                distribution_config
+            )
+        self._compiler_hyperparameters = {}
+        if self.compiler_config:
+            self._compiler_hyperparameters = EstimatorBase._json_encode_hyperparameters(
+                self.compiler_config._to_hyperparameter_dict()
+            )
+
     def _pytorch_distribution_configuration(self, distribution):
         """Returns a dict of distribution config for PyTorch training
 
@@ -334,45 +366,35 @@ class PyTorch(Framework):
         Returns:
             dict containing Pytorch DDP config
         """
-        distribution_config = {}
-        pytorch_ddp_enabled = False
-        torch_distributed_enabled = False
-
-        if "pytorchddp" in distribution:
-            pytorch_ddp_enabled = distribution.get("pytorchddp").get("enabled", False)
-        elif "torch_distributed" in distribution:
-            torch_distributed_enabled = distribution.get("torch_distributed").get("enabled", False)
+        pytorch_ddp = distribution.get("pytorchddp")
+        torch_distributed = distribution.get("torch_distributed")
+        pytorch_ddp_enabled = bool(pytorch_ddp and pytorch_ddp.get("enabled", False))
+        torch_distributed_enabled = bool(
+            pytorch_ddp is None and torch_distributed and torch_distributed.get("enabled", False)
+        )
 
         if pytorch_ddp_enabled:
-            distribution_config[self.LAUNCH_PYTORCH_DDP_ENV_NAME] = pytorch_ddp_enabled
-            if self.instance_type is not None:
-                distribution_config[self.INSTANCE_TYPE_ENV_NAME] = self.instance_type
+            distribution_config = {self.LAUNCH_PYTORCH_DDP_ENV_NAME: pytorch_ddp_enabled}
         elif torch_distributed_enabled:
-            if "smdistributed" in distribution:
-                # Enable torch_distributed for smdistributed.
-                distribution_config = self._distribution_configuration(distribution=distribution)
+            # Enable torch_distributed for smdistributed.
+            distribution_config = (
+                self._distribution_configuration(distribution=distribution)
+                if "smdistributed" in distribution
+                else {}
+            )
             distribution_config[self.LAUNCH_TORCH_DISTRIBUTED_ENV_NAME] = torch_distributed_enabled
-            if self.instance_type is not None:
-                distribution_config[self.INSTANCE_TYPE_ENV_NAME] = self.instance_type
         else:
-            distribution_config = self._distribution_configuration(distribution=distribution)
+            return self._distribution_configuration(distribution=distribution)
 
+        if self.instance_type is not None:
+            distribution_config[self.INSTANCE_TYPE_ENV_NAME] = self.instance_type
         return distribution_config
 
     def hyperparameters(self):
         """Return hyperparameters used by your custom PyTorch code during model training."""
         hyperparameters = super(PyTorch, self).hyperparameters()
-        additional_hyperparameters = self._pytorch_distribution_configuration(
-            distribution=self.distribution
-        )
-        hyperparameters.update(
-            EstimatorBase._json_encode_hyperparameters(additional_hyperparameters)
-        )
-        if self.compiler_config:
-            training_compiler_hyperparameters = self.compiler_config._to_hyperparameter_dict()
-            hyperparameters.update(
-                EstimatorBase._json_encode_hyperparameters(training_compiler_hyperparameters)
-            )
+        hyperparameters.update(self._distribution_hyperparameters)
+        hyperparameters.update(self._compiler_hyperparameters)
 
         return hyperparameters
 
@@ -13,9 +13,9 @@
 """Placeholder docstring"""
 from __future__ import absolute_import
 
-import copy
+import functools
+import time
 from abc import ABC, abstractmethod
-from datetime import datetime, timedelta
 from typing import Type
 import logging
 
@@ -47,12 +47,12 @@ from sagemaker.serve.utils.tuning import (
     _pretty_print_results_jumpstart,
     _serial_benchmark,
     _concurrent_benchmark,
-    _more_performant,
+    _more_performant_result,
     _sharded_supported,
+    _TuningResult,
 )
 from sagemaker.serve.utils.types import ModelServer
 from sagemaker.base_predictor import PredictorBase
-from sagemaker.jumpstart.model import JumpStartModel
 
 _DJL_MODEL_BUILDER_ENTRY_POINT = "inference.py"
 _NO_JS_MODEL_EX = "HuggingFace JumpStart Model ID not detected. Building for HuggingFace Model ID."
@@ -62,10 +62,33 @@ _JS_ENABLED_MODEL_SERVERS = {
     ModelServer.DJL_SERVING,
     ModelServer.TGI,
 }
+# (image URI marker, model server, build method, tune method) checked in order
+_JS_IMAGE_URI_DISPATCH = (
+    (
+        "djl-inference",
+        ModelServer.DJL_SERVING,
+        "_build_for_djl_jumpstart",
+        "tune_for_djl_jumpstart",
+    ),
+    ("tgi-inference", ModelServer.TGI, "_build_for_tgi_jumpstart", "tune_for_tgi_jumpstart"),
+    ("huggingface-pytorch-inference:", ModelServer.MMS, "_build_for_mms_jumpstart", None),
+)
+# Stop tuning once this many consecutive configurations fail to beat the best one.
+_MAX_TUNING_REGRESSIONS = 2
 
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=512)
+def _has_js_model_uri(model_id: str) -> bool:
+    """Returns True if JumpStart has an inference model URI for ``model_id``."""
+    try:
+        model_uris.retrieve(model_id=model_id, model_version="*", model_scope=_JS_SCOPE)
+    except KeyError:
+        return False
+    return True
+
+
 class JumpStart(ABC):
     """DJL build logic for ModelBuilder()"""
 
@@ -97,6 +120,7 @@ class JumpStart(ABC):
         self.nb_instance_type = None
         self.ram_usage_model_load = None
         self.jumpstart = None
+        self._admissible_degrees_cache = None
 
     @abstractmethod
     def _prepare_for_mode(self):
@@ -108,9 +132,7 @@ class JumpStart(ABC):
 
     def _is_jumpstart_model_id(self) -> bool:
         """Placeholder docstring"""
-        try:
-            model_uris.retrieve(model_id=self.model, model_version="*", model_scope=_JS_SCOPE)
-        except KeyError:
+        if not _has_js_model_uri(self.model):
             logger.warning(_NO_JS_MODEL_EX)
             return False
 
@@ -119,6 +141,10 @@ class JumpStart(ABC):
 
     def _create_pre_trained_js_model(self) -> Type[Model]:
         """Placeholder docstring"""
+        # Deferred: JumpStartModel pulls in the JumpStart manifest and cache modules,
+        # which ModelBuilder users outside JumpStart never need.
+        from sagemaker.jumpstart.model import JumpStartModel
+
         pysdk_model = JumpStartModel(self.model, vpc_config=self.vpc_config)
         pysdk_model.sagemaker_session = self.sagemaker_session
 
@@ -140,16 +166,14 @@ class JumpStart(ABC):
 
             if overwrite_mode == Mode.SAGEMAKER_ENDPOINT:
                 self.mode = self.pysdk_model.mode = Mode.SAGEMAKER_ENDPOINT
-                if (
-                    not hasattr(self, "prepared_for_djl")
-                    or not hasattr(self, "prepared_for_tgi")
-                    or not hasattr(self, "prepared_for_mms")
-                ):
-                    self.pysdk_model.model_data, env = self._prepare_for_mode()
+                self.pysdk_model.model_data, env = self._prepare_for_mode()
             elif overwrite_mode == Mode.LOCAL_CONTAINER:
                 self.mode = self.pysdk_model.mode = Mode.LOCAL_CONTAINER
 
-                if not hasattr(self, "prepared_for_djl"):
+                if (
+                    self.model_server == ModelServer.DJL_SERVING
+                    and getattr(self, "prepared_for_djl", None) is None
+                ):
                     (
                         self.existing_properties,
                         self.js_model_config,
@@ -160,14 +184,20 @@ class JumpStart(ABC):
                         dependencies=self.dependencies,
                         model_data=self.pysdk_model.model_data,
                     )
-                elif not hasattr(self, "prepared_for_tgi"):
+                elif (
+                    self.model_server == ModelServer.TGI
+                    and getattr(self, "prepared_for_tgi", None) is None
+                ):
                     self.js_model_config, self.prepared_for_tgi = prepare_tgi_js_resources(
                         model_path=self.model_path,
                         js_id=self.model,
                         dependencies=self.dependencies,
                         model_data=self.pysdk_model.model_data,
                     )
-                elif not hasattr(self, "prepared_for_mms"):
+                elif (
+                    self.model_server == ModelServer.MMS
+                    and getattr(self, "prepared_for_mms", None) is None
+                ):
                     self.js_model_config, self.prepared_for_mms = prepare_mms_js_resources(
                         model_path=self.model_path,
                         js_id=self.model,
@@ -236,7 +266,7 @@ class JumpStart(ABC):
         env = {}
         _create_dir_structure(self.model_path)
         if self.mode == Mode.LOCAL_CONTAINER:
-            if not hasattr(self, "prepared_for_djl"):
+            if getattr(self, "prepared_for_djl", None) is None:
                 (
                     self.existing_properties,
                     self.js_model_config,
@@ -248,7 +278,10 @@ class JumpStart(ABC):
                     model_data=self.pysdk_model.model_data,
                 )
             self._prepare_for_mode()
-        elif self.mode == Mode.SAGEMAKER_ENDPOINT and hasattr(self, "prepared_for_djl"):
+        elif (
+            self.mode == Mode.SAGEMAKER_ENDPOINT
+            and getattr(self, "prepared_for_djl", None) is not None
+        ):
             self.nb_instance_type = _get_nb_instance()
             self.pysdk_model.model_data, env = self._prepare_for_mode()
 
@@ -259,7 +292,7 @@ class JumpStart(ABC):
 
         env = {}
         if self.mode == Mode.LOCAL_CONTAINER:
-            if not hasattr(self, "prepared_for_tgi"):
+            if getattr(self, "prepared_for_tgi", None) is None:
                 self.js_model_config, self.prepared_for_tgi = prepare_tgi_js_resources(
                     model_path=self.model_path,
                     js_id=self.model,
@@ -267,7 +300,10 @@ class JumpStart(ABC):
                     model_data=self.pysdk_model.model_data,
                 )
             self._prepare_for_mode()
-        elif self.mode == Mode.SAGEMAKER_ENDPOINT and hasattr(self, "prepared_for_tgi"):
+        elif (
+            self.mode == Mode.SAGEMAKER_ENDPOINT
+            and getattr(self, "prepared_for_tgi", None) is not None
+        ):
             self.pysdk_model.model_data, env = self._prepare_for_mode()
 
         self.pysdk_model.env.update(env)
@@ -277,7 +313,7 @@ class JumpStart(ABC):
 
         env = {}
         if self.mode == Mode.LOCAL_CONTAINER:
-            if not hasattr(self, "prepared_for_mms"):
+            if getattr(self, "prepared_for_mms", None) is None:
                 self.js_model_config, self.prepared_for_mms = prepare_mms_js_resources(
                     model_path=self.model_path,
                     js_id=self.model,
@@ -285,11 +321,34 @@ class JumpStart(ABC):
                     model_data=self.pysdk_model.model_data,
                 )
             self._prepare_for_mode()
-        elif self.mode == Mode.SAGEMAKER_ENDPOINT and hasattr(self, "prepared_for_mms"):
+        elif (
+            self.mode == Mode.SAGEMAKER_ENDPOINT
+            and getattr(self, "prepared_for_mms", None) is not None
+        ):
             self.pysdk_model.model_data, env = self._prepare_for_mode()
 
         self.pysdk_model.env.update(env)
 
+    def _admissible_tensor_parallel_degrees(self) -> list:
+        """Returns the admissible tensor parallel degrees for the current ``js_model_config``.
+
+        Degrees are de-duplicated and ordered from most to fewest GPUs. The result
+        is cached against the config object so repeated tuning runs do not
+        re-inspect the model config and local GPUs.
+        """
+        # ModelBuilder does not run JumpStart.__init__, so the cache may be unset.
+        cache = getattr(self, "_admissible_degrees_cache", None)
+        if cache is not None and cache[0] is self.js_model_config:
+            return cache[1]
+
+        degrees = _get_admissible_tensor_parallel_degrees(self.js_model_config)
+        if isinstance(degrees, int):
+            degrees = [degrees]
+        # Most GPUs first: once a degree runs out of memory, every smaller one will too.
+        degrees = sorted(set(degrees), reverse=True)
+        self._admissible_degrees_cache = (self.js_model_config, degrees)
+        return degrees
+
     def _tune_for_js(self, sharded_supported: bool, max_tuning_duration: int = 1800):
         """Tune for Jumpstart Models in Local Mode.
 
@@ -310,10 +369,8 @@ class JumpStart(ABC):
         if "OPTION_TENSOR_PARALLEL_DEGREE" in self.pysdk_model.env.keys():
             num_shard_env_var_name = "OPTION_TENSOR_PARALLEL_DEGREE"
 
-        initial_env_vars = copy.deepcopy(self.pysdk_model.env)
-        admissible_tensor_parallel_degrees = _get_admissible_tensor_parallel_degrees(
-            self.js_model_config
-        )
+        initial_env_vars = dict(self.pysdk_model.env)
+        admissible_tensor_parallel_degrees = self._admissible_tensor_parallel_degrees()
 
         if len(admissible_tensor_parallel_degrees) > 1 and not sharded_supported:
             admissible_tensor_parallel_degrees = [1]
@@ -322,11 +379,12 @@ class JumpStart(ABC):
                 "Model can only be sharded across [1] GPU"
             )
 
-        benchmark_results = {}
+        benchmark_results = []
         best_tuned_combination = None
-        timeout = datetime.now() + timedelta(seconds=max_tuning_duration)
+        regressions = 0
+        deadline = time.monotonic() + max_tuning_duration
         for tensor_parallel_degree in admissible_tensor_parallel_degrees:
-            if datetime.now() > timeout:
+            if time.monotonic() > deadline:
                 logger.info("Max tuning duration reached. Tuning stopped.")
                 break
 
@@ -343,49 +401,42 @@ class JumpStart(ABC):
                     predictor, self.schema_builder.sample_input
                 )
 
-                tested_env = copy.deepcopy(self.pysdk_model.env)
                 logger.info(
                     "Average latency: %s, throughput/s: %s for configuration: %s",
                     avg_latency,
                     throughput_per_second,
-                    tested_env,
+                    self.pysdk_model.env,
                 )
-                benchmark_results[avg_latency] = [
-                    tested_env,
-                    p90,
-                    avg_tokens_per_second,
-                    throughput_per_second,
-                    standard_deviation,
-                ]
-
-                if not best_tuned_combination:
-                    best_tuned_combination = [
-                        avg_latency,
-                        tensor_parallel_degree,
-                        None,
-                        p90,
-                        avg_tokens_per_second,
-                        throughput_per_second,
-                        standard_deviation,
-                    ]
+                tuning_result = _TuningResult(
+                    avg_latency=avg_latency,
+                    tensor_parallel_degree=tensor_parallel_degree,
+                    p90=p90,
+                    avg_tokens_per_second=avg_tokens_per_second,
+                    throughput_per_second=throughput_per_second,
+                    standard_deviation=standard_deviation,
+                )
+                benchmark_results.append(tuning_result)
+
+                if best_tuned_combination is None:
+                    best_tuned_combination = tuning_result
+                elif _more_performant_result(best_tuned_combination, tuning_result):
+                    best_tuned_combination = tuning_result
+                    regressions = 0
                 else:
-                    tuned_configuration = [
-                        avg_latency,
-                        tensor_parallel_degree,
-                        None,
-                        p90,
-                        avg_tokens_per_second,
-                        throughput_per_second,
-                        standard_deviation,
-                    ]
-                    if _more_performant(best_tuned_combination, tuned_configuration):
-                        best_tuned_combination = tuned_configuration
+                    regressions += 1
+                    if regressions >= _MAX_TUNING_REGRESSIONS:
+                        logger.info(
+                            "%s consecutive configurations were less performant. "
+                            "Tuning stopped.",
+                            regressions,
+                        )
+                        break
             except LocalDeepPingException as e:
                 logger.warning(
                     "Deployment unsuccessful with %s: %s. " "Failed to invoke the model server: %s",
                     num_shard_env_var_name,
                     tensor_parallel_degree,
-                    str(e),
+                    e,
                 )
             except LocalModelOutOfMemoryException as e:
                 logger.warning(
@@ -393,8 +444,12 @@ class JumpStart(ABC):
                     "Out of memory when loading the model: %s",
                     num_shard_env_var_name,
                     tensor_parallel_degree,
-                    str(e),
+                    e,
                 )
+                # Degrees are tried from most to fewest GPUs (see
+                # _admissible_tensor_parallel_degrees), so every remaining degree
+                # needs at least as much memory per GPU.
+                break
             except LocalModelInvocationException as e:
                 logger.warning(
                     "Deployment unsuccessful with %s: %s. "
@@ -403,14 +458,14 @@ class JumpStart(ABC):
                     "(Ex. serialization, deserialization, content_type, accept).",
                     num_shard_env_var_name,
                     tensor_parallel_degree,
-                    str(e),
+                    e,
                 )
             except LocalModelLoadException as e:
                 logger.warning(
                     "Deployment unsuccessful with %s: %s. " "Failed to load the model: %s.",
                     num_shard_env_var_name,
                     tensor_parallel_degree,
-                    str(e),
+                    e,
                 )
             except SkipTuningComboException as e:
                 logger.warning(
@@ -419,7 +474,7 @@ class JumpStart(ABC):
                     "Trying next combination.",
                     num_shard_env_var_name,
                     tensor_parallel_degree,
-                    str(e),
+                    e,
                 )
             except Exception:  # pylint: disable=W0703
                 logger.exception(
@@ -428,20 +483,22 @@ class JumpStart(ABC):
                     tensor_parallel_degree,
                 )
 
-        if best_tuned_combination:
-            self.pysdk_model.env.update({num_shard_env_var_name: str(best_tuned_combination[1])})
+        if best_tuned_combination is not None:
+            self.pysdk_model.env.update(
+                {num_shard_env_var_name: str(best_tuned_combination.tensor_parallel_degree)}
+            )
 
-            _pretty_print_results_jumpstart(benchmark_results, [num_shard_env_var_name])
+            _pretty_print_results_jumpstart(benchmark_results, num_shard_env_var_name)
             logger.info(
                 "Model Configuration: %s was most performant with avg latency: %s, "
                 "p90 latency: %s, average tokens per second: %s, throughput/s: %s, "
                 "standard deviation of request %s",
                 self.pysdk_model.env,
-                best_tuned_combination[0],
-                best_tuned_combination[3],
-                best_tuned_combination[4],
-                best_tuned_combination[5],
-                best_tuned_combination[6],
+                best_tuned_combination.avg_latency,
+                best_tuned_combination.p90,
+                best_tuned_combination.avg_tokens_per_second,
+                best_tuned_combination.throughput_per_second,
+                best_tuned_combination.standard_deviation,
             )
         else:
             self.pysdk_model.env.update(initial_env_vars)
@@ -483,36 +540,24 @@ class JumpStart(ABC):
                 "JumpStart Gated Models are only supported in SAGEMAKER_ENDPOINT mode."
             )
 
-        if "djl-inference" in image_uri:
-            logger.info("Building for DJL JumpStart Model ID...")
-            self.model_server = ModelServer.DJL_SERVING
-            self.pysdk_model = pysdk_model
-            self.image_uri = self.pysdk_model.image_uri
-
-            self._build_for_djl_jumpstart()
-
-            self.pysdk_model.tune = self.tune_for_djl_jumpstart
-        elif "tgi-inference" in image_uri:
-            logger.info("Building for TGI JumpStart Model ID...")
-            self.model_server = ModelServer.TGI
-            self.pysdk_model = pysdk_model
-            self.image_uri = self.pysdk_model.image_uri
+        for image_uri_marker, model_server, build_attr, tune_attr in _JS_IMAGE_URI_DISPATCH:
+            if image_uri_marker in image_uri:
+                logger.info("Building for %s JumpStart Model ID...", model_server)
+                self.model_server = model_server
+                self.pysdk_model = pysdk_model
+                self.image_uri = self.pysdk_model.image_uri
 
-            self._build_for_tgi_jumpstart()
+                getattr(self, build_attr)()
 
-            self.pysdk_model.tune = self.tune_for_tgi_jumpstart
-        elif "huggingface-pytorch-inference:" in image_uri:
-            logger.info("Building for MMS JumpStart Model ID...")
-            self.model_server = ModelServer.MMS
-            self.pysdk_model = pysdk_model
-            self.image_uri = self.pysdk_model.image_uri
-
-            self._build_for_mms_jumpstart()
-        elif self.mode != Mode.SAGEMAKER_ENDPOINT:
-            raise ValueError(
-                "JumpStart Model ID was not packaged "
-                "with djl-inference, tgi-inference, or mms-inference container."
-            )
+                if tune_attr:
+                    self.pysdk_model.tune = getattr(self, tune_attr)
+                break
+        else:
+            if self.mode != Mode.SAGEMAKER_ENDPOINT:
+                raise ValueError(
+                    "JumpStart Model ID was not packaged "
+                    "with djl-inference, tgi-inference, or mms-inference container."
+                )
 
         return self.pysdk_model
 
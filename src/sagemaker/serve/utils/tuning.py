@@ -3,6 +3,8 @@
 from __future__ import absolute_import
 
 import logging
+from dataclasses import dataclass
+from operator import attrgetter
 from time import perf_counter
 import collections
 from multiprocessing.pool import ThreadPool
@@ -20,6 +22,27 @@ MARGIN = 10
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class _TuningResult:
+    """Benchmark metrics gathered for one tuned model configuration."""
+
+    __slots__ = (
+        "avg_latency",
+        "tensor_parallel_degree",
+        "p90",
+        "avg_tokens_per_second",
+        "throughput_per_second",
+        "standard_deviation",
+    )
+
+    avg_latency: float
+    tensor_parallel_degree: int
+    p90: float
+    avg_tokens_per_second: float
+    throughput_per_second: float
+    standard_deviation: float
+
+
 def _pretty_print_results(results: dict):
     """Placeholder docstring"""
     avg_latencies = []
@@ -100,31 +123,22 @@ def _pretty_print_results_tgi(results: dict):
     )
 
 
-def _pretty_print_results_jumpstart(results: dict, model_env_vars=None):
-    """Pretty prints benchmark results"""
-    if model_env_vars is None:
-        model_env_vars = []
-
-    __env_var_data = {}
-    for model_env_var in model_env_vars:
-        __env_var_data[model_env_var] = []
-
+def _pretty_print_results_jumpstart(results: list, num_shard_env_var_name: str):
+    """Pretty prints a list of ``_TuningResult``, ordered by average latency"""
     avg_latencies = []
     p90s = []
     avg_tokens_per_seconds = []
     throughput_per_seconds = []
     standard_deviations = []
-    ordered = collections.OrderedDict(sorted(results.items()))
-
-    for key, value in ordered.items():
-        avg_latencies.append(key)
-        p90s.append(value[1])
-        avg_tokens_per_seconds.append(value[2])
-        throughput_per_seconds.append(value[3])
-        standard_deviations.append(value[4])
+    tensor_parallel_degrees = []
 
-        for model_env_var in __env_var_data:
-            __env_var_data[model_env_var].append(value[0][model_env_var])
+    for result in sorted(results, key=attrgetter("avg_latency")):
+        avg_latencies.append(result.avg_latency)
+        p90s.append(result.p90)
+        avg_tokens_per_seconds.append(result.avg_tokens_per_second)
+        throughput_per_seconds.append(result.throughput_per_second)
+        standard_deviations.append(result.standard_deviation)
+        tensor_parallel_degrees.append(str(result.tensor_parallel_degree))
 
     df = pd.DataFrame(
         {
@@ -133,7 +147,7 @@ def _pretty_print_results_jumpstart(results: dict, model_env_vars=None):
             "AverageTokensPerSecond (Serial)": avg_tokens_per_seconds,
             "ThroughputPerSecond (Concurrent)": throughput_per_seconds,
             "StandardDeviationResponse (Concurrent)": standard_deviations,
-            **__env_var_data,
+            num_shard_env_var_name: tensor_parallel_degrees,
         }
     )
 
@@ -254,11 +268,36 @@ def _within_margins(margin: int, threshold: int, value1: float, value2: float) -
 
 def _more_performant(best_tuned_configuration: list, tuned_configuration: list) -> bool:
     """Placeholder docstring"""
-    best_avg_latency = best_tuned_configuration[0]
-    tuned_avg_latency = tuned_configuration[0]
-    best_standard_deviation = best_tuned_configuration[6]
-    tuned_standard_deviation = tuned_configuration[6]
+    return _is_more_performant(
+        best_tuned_configuration[0],
+        best_tuned_configuration[6],
+        tuned_configuration[0],
+        tuned_configuration[6],
+    )
+
+
+def _more_performant_result(best_result: _TuningResult, tuned_result: _TuningResult) -> bool:
+    """Returns True if ``tuned_result`` is at least as performant as ``best_result``"""
+    return _is_more_performant(
+        best_result.avg_latency,
+        best_result.standard_deviation,
+        tuned_result.avg_latency,
+        tuned_result.standard_deviation,
+    )
+
+
+def _is_more_performant(
+    best_avg_latency: float,
+    best_standard_deviation: float,
+    tuned_avg_latency: float,
+    tuned_standard_deviation: float,
+) -> bool:
+    """Returns True if the tuned configuration is at least as performant as the best one.
 
+    Average latencies that differ by more than zero but at most ``5 / MARGIN`` are
+    treated as a tie, decided by the lower or equal standard deviation. Otherwise
+    the lower or equal average latency wins.
+    """
     if _within_margins(MARGIN, 5, tuned_avg_latency, best_avg_latency):
         if tuned_standard_deviation <= best_standard_deviation:
             return True
@@ -0,0 +1,25 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from __future__ import absolute_import
+
+import pytest
+
+from sagemaker.serve.builder.jumpstart_builder import _has_js_model_uri
+
+
+@pytest.fixture(autouse=True)
+def clear_js_model_uri_cache():
+    """Tests patch model_uris.retrieve differently, so lookups must not leak between them."""
+    _has_js_model_uri.cache_clear()
+    yield
+    _has_js_model_uri.cache_clear()
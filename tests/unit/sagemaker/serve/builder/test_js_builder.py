@@ -22,6 +22,7 @@ from sagemaker.serve.utils.exceptions import (
     LocalModelLoadException,
     LocalModelOutOfMemoryException,
     LocalModelInvocationException,
+    SkipTuningComboException,
 )
 
 mock_model_id = "huggingface-llm-amazon-falconlite"
@@ -168,6 +169,50 @@ class TestJumpStartBuilder(unittest.TestCase):
 
         mock_prepare_for_mms.assert_called()
 
+    @patch("sagemaker.serve.builder.jumpstart_builder._capture_telemetry", side_effect=None)
+    @patch(
+        "sagemaker.serve.builder.jumpstart_builder.JumpStart._is_jumpstart_model_id",
+        return_value=True,
+    )
+    @patch(
+        "sagemaker.serve.builder.jumpstart_builder.JumpStart._create_pre_trained_js_model",
+        return_value=MagicMock(),
+    )
+    @patch(
+        "sagemaker.serve.builder.jumpstart_builder.prepare_mms_js_resources",
+        return_value=({"model_type": "t5", "n_head": 71}, True),
+    )
+    @patch("sagemaker.serve.builder.jumpstart_builder._get_ram_usage_mb", return_value=1024)
+    @patch(
+        "sagemaker.serve.builder.jumpstart_builder._get_nb_instance", return_value="ml.g5.24xlarge"
+    )
+    def test__build_for_mms_jumpstart_prepares_when_unset(
+        self,
+        mock_get_nb_instance,
+        mock_get_ram_usage_mb,
+        mock_prepare_for_mms,
+        mock_pre_trained_model,
+        mock_is_jumpstart_model,
+        mock_telemetry,
+    ):
+        builder = ModelBuilder(
+            model="facebook/galactica-mock-model-id",
+            schema_builder=mock_schema_builder,
+            mode=Mode.LOCAL_CONTAINER,
+        )
+        builder.prepared_for_mms = None
+
+        mock_pre_trained_model.return_value.image_uri = (
+            "763104351884.dkr.ecr.us-west-2.amazonaws.com/huggingface"
+            "-pytorch-inference:2.1.0-transformers4.37.0-gpu-py310-cu118"
+            "-ubuntu20.04"
+        )
+
+        builder.build()
+
+        mock_prepare_for_mms.assert_called_once()
+        self.assertTrue(builder.prepared_for_mms)
+
     @patch("sagemaker.serve.builder.jumpstart_builder._capture_telemetry", side_effect=None)
     @patch(
         "sagemaker.serve.builder.jumpstart_builder.JumpStart._is_jumpstart_model_id",
@@ -595,6 +640,49 @@ class TestJumpStartBuilder(unittest.TestCase):
         tuned_model = model.tune()
         assert tuned_model.env == mock_djl_model_serving_properties
 
+    @patch("sagemaker.serve.builder.jumpstart_builder._capture_telemetry", side_effect=None)
+    @patch(
+        "sagemaker.serve.builder.jumpstart_builder.JumpStart._is_jumpstart_model_id",
+        return_value=True,
+    )
+    @patch(
+        "sagemaker.serve.builder.jumpstart_builder.JumpStart._create_pre_trained_js_model",
+        return_value=MagicMock(),
+    )
+    @patch(
+        "sagemaker.serve.builder.jumpstart_builder.prepare_tgi_js_resources",
+        return_value=({"model_type": "t5", "n_head": 71}, True),
+    )
+    @patch("sagemaker.serve.builder.jumpstart_builder.prepare_djl_js_resources")
+    @patch("sagemaker.serve.builder.jumpstart_builder._get_ram_usage_mb", return_value=1024)
+    @patch("sagemaker.serve.builder.model_builder.LocalContainerMode")
+    def test_js_deploy_override_to_local_container_prepares_tgi(
+        self,
+        mock_local_container_mode,
+        mock_get_ram_usage_mb,
+        mock_prepare_for_djl,
+        mock_prepare_for_tgi,
+        mock_pre_trained_model,
+        mock_is_jumpstart_model,
+        mock_telemetry,
+    ):
+        builder = ModelBuilder(
+            model=mock_model_id, schema_builder=mock_schema_builder, mode=Mode.SAGEMAKER_ENDPOINT
+        )
+
+        mock_pre_trained_model.return_value.image_uri = mock_tgi_image_uri
+
+        builder.build()
+        builder.serve_settings.telemetry_opt_out = True
+        mock_prepare_for_tgi.assert_not_called()
+
+        builder._js_builder_deploy_wrapper(mode=Mode.LOCAL_CONTAINER)
+
+        mock_prepare_for_tgi.assert_called_once()
+        mock_prepare_for_djl.assert_not_called()
+        mock_local_container_mode.return_value.create_server.assert_called_once()
+        self.assertEqual(builder.mode, Mode.LOCAL_CONTAINER)
+
     @patch("sagemaker.serve.builder.jumpstart_builder._capture_telemetry", side_effect=None)
     @patch(
         "sagemaker.serve.builder.jumpstart_builder.JumpStart._is_jumpstart_model_id",
@@ -724,3 +812,223 @@ class TestJumpStartBuilder(unittest.TestCase):
             ValueError,
             lambda: builder.build(),
         )
+
+    @patch("sagemaker.serve.builder.jumpstart_builder._capture_telemetry", side_effect=None)
+    @patch(
+        "sagemaker.serve.builder.jumpstart_builder.JumpStart._is_jumpstart_model_id",
+        return_value=True,
+    )
+    @patch(
+        "sagemaker.serve.builder.jumpstart_builder.JumpStart._create_pre_trained_js_model",
+        return_value=MagicMock(),
+    )
+    @patch(
+        "sagemaker.serve.builder.jumpstart_builder.prepare_tgi_js_resources",
+        return_value=({"model_type": "t5", "n_head": 71}, True),
+    )
+    @patch("sagemaker.serve.builder.jumpstart_builder._get_ram_usage_mb", return_value=1024)
+    @patch(
+        "sagemaker.serve.builder.jumpstart_builder._get_nb_instance", return_value="ml.g5.24xlarge"
+    )
+    @patch(
+        "sagemaker.serve.builder.jumpstart_builder._get_admissible_tensor_parallel_degrees",
+        return_value=[8, 4, 2, 1],
+    )
+    @patch(
+        "sagemaker.serve.builder.jumpstart_builder._serial_benchmark",
+        side_effect=[(5, 5, 25), (6, 6, 20), (7, 7, 15), (1, 1, 50)],
+    )
+    @patch(
+        "sagemaker.serve.builder.jumpstart_builder._concurrent_benchmark",
+        side_effect=[(0.9, 1), (0.8, 1), (0.7, 1), (2.0, 1)],
+    )
+    def test_tune_for_tgi_js_local_container_stops_after_regressions(
+        self,
+        mock_concurrent_benchmarks,
+        mock_serial_benchmarks,
+        mock_admissible_tensor_parallel_degrees,
+        mock_get_nb_instance,
+        mock_get_ram_usage_mb,
+        mock_prepare_for_tgi,
+        mock_pre_trained_model,
+        mock_is_jumpstart_model,
+        mock_telemetry,
+    ):
+        builder = ModelBuilder(
+            model="facebook/galactica-mock-model-id",
+            schema_builder=mock_schema_builder,
+            mode=Mode.LOCAL_CONTAINER,
+        )
+
+        mock_pre_trained_model.return_value.image_uri = mock_tgi_image_uri
+
+        model = builder.build()
+        builder.serve_settings.telemetry_opt_out = True
+
+        mock_pre_trained_model.return_value.env = dict(mock_tgi_model_serving_properties)
+
+        tuned_model = model.tune()
+
+        assert mock_serial_benchmarks.call_count == 3
+        assert tuned_model.env["SM_NUM_GPUS"] == "8"
+
+    @patch("sagemaker.serve.builder.jumpstart_builder._capture_telemetry", side_effect=None)
+    @patch(
+        "sagemaker.serve.builder.jumpstart_builder.JumpStart._is_jumpstart_model_id",
+        return_value=True,
+    )
+    @patch(
+        "sagemaker.serve.builder.jumpstart_builder.JumpStart._create_pre_trained_js_model",
+        return_value=MagicMock(),
+    )
+    @patch(
+        "sagemaker.serve.builder.jumpstart_builder.prepare_tgi_js_resources",
+        return_value=({"model_type": "t5", "n_head": 71}, True),
+    )
+    @patch("sagemaker.serve.builder.jumpstart_builder._get_ram_usage_mb", return_value=1024)
+    @patch(
+        "sagemaker.serve.builder.jumpstart_builder._get_nb_instance", return_value="ml.g5.24xlarge"
+    )
+    @patch(
+        "sagemaker.serve.builder.jumpstart_builder._get_admissible_tensor_parallel_degrees",
+        return_value=[8, 4, 2, 1],
+    )
+    @patch(
+        "sagemaker.serve.builder.jumpstart_builder._serial_benchmark",
+        side_effect=LocalModelOutOfMemoryException("mock_exception"),
+    )
+    def test_tune_for_tgi_js_local_container_stops_on_oom(
+        self,
+        mock_serial_benchmarks,
+        mock_admissible_tensor_parallel_degrees,
+        mock_get_nb_instance,
+        mock_get_ram_usage_mb,
+        mock_prepare_for_tgi,
+        mock_pre_trained_model,
+        mock_is_jumpstart_model,
+        mock_telemetry,
+    ):
+        builder = ModelBuilder(
+            model="facebook/galactica-mock-model-id",
+            schema_builder=mock_schema_builder,
+            mode=Mode.LOCAL_CONTAINER,
+        )
+
+        mock_pre_trained_model.return_value.image_uri = mock_tgi_image_uri
+
+        model = builder.build()
+        builder.serve_settings.telemetry_opt_out = True
+
+        mock_pre_trained_model.return_value.env = dict(mock_tgi_model_serving_properties)
+
+        tuned_model = model.tune()
+
+        assert mock_serial_benchmarks.call_count == 1
+        assert tuned_model.env == mock_tgi_model_serving_properties
+
+    @patch("sagemaker.serve.builder.jumpstart_builder._capture_telemetry", side_effect=None)
+    @patch(
+        "sagemaker.serve.builder.jumpstart_builder.JumpStart._is_jumpstart_model_id",
+        return_value=True,
+    )
+    @patch(
+        "sagemaker.serve.builder.jumpstart_builder.JumpStart._create_pre_trained_js_model",
+        return_value=MagicMock(),
+    )
+    @patch(
+        "sagemaker.serve.builder.jumpstart_builder.prepare_tgi_js_resources",
+        return_value=({"model_type": "t5", "n_head": 71}, True),
+    )
+    @patch("sagemaker.serve.builder.jumpstart_builder._get_ram_usage_mb", return_value=1024)
+    @patch(
+        "sagemaker.serve.builder.jumpstart_builder._get_nb_instance", return_value="ml.g5.24xlarge"
+    )
+    @patch(
+        "sagemaker.serve.builder.jumpstart_builder._get_admissible_tensor_parallel_degrees",
+        return_value=[8, 4, 2, 1],
+    )
+    @patch(
+        "sagemaker.serve.builder.jumpstart_builder._serial_benchmark",
+        side_effect=[
+            SkipTuningComboException("mock_exception"),
+            SkipTuningComboException("mock_exception"),
+            SkipTuningComboException("mock_exception"),
+            (5, 5, 25),
+        ],
+    )
+    @patch(
+        "sagemaker.serve.builder.jumpstart_builder._concurrent_benchmark",
+        return_value=(0.9, 1),
+    )
+    def test_tune_for_tgi_js_local_container_continues_after_skipped_combos(
+        self,
+        mock_concurrent_benchmarks,
+        mock_serial_benchmarks,
+        mock_admissible_tensor_parallel_degrees,
+        mock_get_nb_instance,
+        mock_get_ram_usage_mb,
+        mock_prepare_for_tgi,
+        mock_pre_trained_model,
+        mock_is_jumpstart_model,
+        mock_telemetry,
+    ):
+        builder = ModelBuilder(
+            model="facebook/galactica-mock-model-id",
+            schema_builder=mock_schema_builder,
+            mode=Mode.LOCAL_CONTAINER,
+        )
+
+        mock_pre_trained_model.return_value.image_uri = mock_tgi_image_uri
+
+        model = builder.build()
+        builder.serve_settings.telemetry_opt_out = True
+
+        mock_pre_trained_model.return_value.env = dict(mock_tgi_model_serving_properties)
+
+        tuned_model = model.tune()
+
+        assert mock_serial_benchmarks.call_count == 4
+        assert tuned_model.env["SM_NUM_GPUS"] == "1"
+
+    @patch("sagemaker.serve.builder.jumpstart_builder.model_uris.retrieve")
+    def test_is_jumpstart_model_id_is_cached(self, mock_retrieve):
+        builder = ModelBuilder(model=mock_model_id, schema_builder=mock_schema_builder)
+
+        assert builder._is_jumpstart_model_id()
+        assert builder._is_jumpstart_model_id()
+        mock_retrieve.assert_called_once_with(
+            model_id=mock_model_id, model_version="*", model_scope="inference"
+        )
+
+        mock_retrieve.side_effect = KeyError
+        builder.model = mock_t5_model_id
+        assert not builder._is_jumpstart_model_id()
+
+    @patch(
+        "sagemaker.serve.builder.jumpstart_builder._get_admissible_tensor_parallel_degrees",
+        return_value=[4, 2, 1],
+    )
+    def test_admissible_tensor_parallel_degrees_is_cached(self, mock_admissible_degrees):
+        builder = ModelBuilder(model=mock_model_id, schema_builder=mock_schema_builder)
+        builder.js_model_config = {"model_type": "t5", "n_head": 71}
+
+        assert builder._admissible_tensor_parallel_degrees() == [4, 2, 1]
+        assert builder._admissible_tensor_parallel_degrees() == [4, 2, 1]
+        mock_admissible_degrees.assert_called_once_with(builder.js_model_config)
+
+        builder.js_model_config = {"model_type": "t5", "n_head": 32}
+        builder._admissible_tensor_parallel_degrees()
+        assert mock_admissible_degrees.call_count == 2
+
+    @patch(
+        "sagemaker.serve.builder.jumpstart_builder._get_admissible_tensor_parallel_degrees",
+        side_effect=[[2, 8, 2, 4], 1],
+    )
+    def test_admissible_tensor_parallel_degrees_are_ordered(self, mock_admissible_degrees):
+        builder = ModelBuilder(model=mock_model_id, schema_builder=mock_schema_builder)
+
+        builder.js_model_config = {"model_type": "t5", "n_head": 8}
+        assert builder._admissible_tensor_parallel_degrees() == [8, 4, 2]
+
+        builder.js_model_config = {"model_type": "t5"}
+        assert builder._admissible_tensor_parallel_degrees() == [1]
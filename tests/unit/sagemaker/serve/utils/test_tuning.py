@@ -0,0 +1,59 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from __future__ import absolute_import
+
+from unittest.mock import patch
+
+import pytest
+
+from sagemaker.serve.utils.tuning import (
+    _TuningResult,
+    _is_more_performant,
+    _pretty_print_results_jumpstart,
+)
+
+
+def _tuning_result(avg_latency, tensor_parallel_degree, standard_deviation=1):
+    return _TuningResult(
+        avg_latency=avg_latency,
+        tensor_parallel_degree=tensor_parallel_degree,
+        p90=avg_latency,
+        avg_tokens_per_second=10,
+        throughput_per_second=1,
+        standard_deviation=standard_deviation,
+    )
+
+
+@patch("sagemaker.serve.utils.tuning.pd.DataFrame")
+def test_pretty_print_results_jumpstart_keeps_equal_latencies(mock_data_frame):
+    results = [_tuning_result(5, 4), _tuning_result(3, 2), _tuning_result(5, 1)]
+
+    _pretty_print_results_jumpstart(results, "SM_NUM_GPUS")
+
+    data = mock_data_frame.call_args[0][0]
+    assert data["AverageLatency (Serial)"] == [3, 5, 5]
+    assert data["SM_NUM_GPUS"] == ["2", "4", "1"]
+
+
+@pytest.mark.parametrize(
+    "best_latency, best_std, tuned_latency, tuned_std, expected",
+    [
+        (5, 2, 4, 3, True),
+        (4, 2, 5, 1, False),
+        (5, 2, 5, 3, True),
+        (5, 2, 5.4, 1, True),
+        (5, 1, 4.6, 2, False),
+    ],
+)
+def test_is_more_performant(best_latency, best_std, tuned_latency, tuned_std, expected):
+    assert _is_more_performant(best_latency, best_std, tuned_latency, tuned_std) is expected
@@ -22,6 +22,7 @@ from packaging.version import Version
 from sagemaker import image_uris
 from sagemaker.pytorch import defaults
 from sagemaker.pytorch import PyTorch, PyTorchPredictor, PyTorchModel
+from sagemaker.pytorch.estimator import _supports_sagemaker_metrics
 from sagemaker.instance_group import InstanceGroup
 from sagemaker.session_settings import SessionSettings
 
@@ -662,6 +663,22 @@ def test_pt_disable_sm_metrics(
     assert not pytorch.enable_sagemaker_metrics
 
 
+@pytest.mark.parametrize(
+    "framework_version, supported",
+    [
+        ("1.2.0", False),
+        ("1.3", True),
+        ("1.3.1", True),
+        ("1.13.1", True),
+        ("2.0", True),
+        ("1.3.dev0", False),
+        ("1.4rc1", True),
+    ],
+)
+def test_pt_supports_sagemaker_metrics(framework_version, supported):
+    assert _supports_sagemaker_metrics(framework_version) is supported
+
+
 def test_pt_add_environment_variables(
     sagemaker_session, pytorch_training_version, pytorch_training_py_version
 ):
@@ -808,6 +825,42 @@ def test_pytorch_ddp_distribution_configuration(
     assert actual_pytorch_ddp == expected_torch_ddp
 
 
+def test_pytorch_distribution_hyperparameters_computed_once(
+    sagemaker_session, pytorch_ddp_framework_version, pytorch_ddp_py_version
+):
+    test_instance_type = "ml.p4d.24xlarge"
+    pytorch = _pytorch_estimator(
+        sagemaker_session,
+        framework_version=pytorch_ddp_framework_version,
+        py_version=pytorch_ddp_py_version,
+        distribution=DISTRIBUTION_PYTORCH_DDP_ENABLED,
+        instance_type=test_instance_type,
+    )
+    with patch.object(pytorch, "_pytorch_distribution_configuration") as distribution_config:
+        first = pytorch.hyperparameters()
+        second = pytorch.hyperparameters()
+    distribution_config.assert_not_called()
+    assert first == second
+    assert first["sagemaker_distributed_dataparallel_enabled"] == "true"
+    assert first["sagemaker_instance_type"] == json.dumps(test_instance_type)
+
+
+@patch("sagemaker.pytorch.estimator.validate_distribution")
+def test_pytorch_empty_distribution_skips_validation(
+    validate_distribution, sagemaker_session, pytorch_training_version, pytorch_training_py_version
+):
+    pytorch = _pytorch_estimator(
+        sagemaker_session,
+        framework_version=pytorch_training_version,
+        py_version=pytorch_training_py_version,
+        distribution={},
+    )
+
+    validate_distribution.assert_not_called()
+    assert pytorch.distribution == {}
+    assert pytorch._distribution_hyperparameters == {}
+
+
 def test_pytorch_ddp_distribution_configuration_unsupported(sagemaker_session):
     unsupported_framework_version = "1.5.0"
     unsupported_py_version = "py2"